@@ -2,25 +2,38 @@ from __future__ import annotations
 
 import os
 import re
-import json
+import logging
+import asyncio
 import time
 import hashlib
 import sqlite3
+import threading
+import uuid
+from contextlib import asynccontextmanager
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 import html as ihtml
 
-import requests
+import httpx
+import orjson
 import feedparser
 from dateutil import parser as dtparser
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
 from dotenv import load_dotenv
 from google import genai
+from google.genai import types
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # c-speed html -> text
+except ImportError:  # clean_html falls back to the regex stripper
+    HTMLParser = None
 
 
 # -----------------------------
@@ -36,11 +49,36 @@ load_dotenv(DOTENV_PATH)
 DB_PATH = DATA_DIR / "sportabase.db"
 SOURCES_PATH = DATA_DIR / "sources.json"
 
+# 0 = only ingest when POST /ingest is called
+INGEST_INTERVAL_MINUTES = float(os.getenv("INGEST_INTERVAL_MINUTES", "0") or 0)
+
+log = logging.getLogger("sportabase")
+
 
 # -----------------------------
 # app
 # -----------------------------
-app = FastAPI(title="Sportabase API (RSS-first)", version="0.2.1")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ingest runs in the background: POST /ingest only queues a job
+    app.state.ingest_queue = asyncio.Queue()
+    app.state.ingest_pending = set()  # job ids sitting in the queue
+    app.state.ingest_enqueue_lock = asyncio.Lock()
+    for job_id in recover_ingest_jobs():
+        _queue_job(job_id)
+
+    tasks = [asyncio.create_task(ingest_worker())]
+    if INGEST_INTERVAL_MINUTES > 0:
+        tasks.append(asyncio.create_task(ingest_scheduler(INGEST_INTERVAL_MINUTES)))
+    try:
+        yield
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+app = FastAPI(title="Sportabase API (RSS-first)", version="0.2.1", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -66,6 +104,16 @@ class IngestResponse(BaseModel):
     skipped: int
 
 
+class IngestJob(BaseModel):
+    job_id: str
+    status: str  # queued | running | done | failed
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    result: Optional[IngestResponse] = None
+    error: Optional[str] = None
+
+
 class Story(BaseModel):
     id: str
     source: str
@@ -117,11 +165,48 @@ CREATE TABLE IF NOT EXISTS stories (
 );
 
 CREATE INDEX IF NOT EXISTS idx_stories_created_at ON stories(created_at);
-CREATE INDEX IF NOT EXISTS idx_stories_sport ON stories(sport);
-CREATE INDEX IF NOT EXISTS idx_stories_source ON stories(source);
+
+-- filter + ORDER BY created_at DESC LIMIT in one backward index walk
+-- (these also cover plain sport/source lookups, so the old single-column
+-- indexes are dropped)
+CREATE INDEX IF NOT EXISTS idx_stories_sport_created ON stories(sport, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_stories_source_created ON stories(source, created_at DESC);
+DROP INDEX IF EXISTS idx_stories_sport;
+DROP INDEX IF EXISTS idx_stories_source;
+
+CREATE TABLE IF NOT EXISTS tldr_cache (
+  key TEXT PRIMARY KEY,
+  bullets_json TEXT NOT NULL,
+  created_at TEXT NOT NULL,
+  expires_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_tldr_cache_expires_at ON tldr_cache(expires_at);
+
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+  id TEXT PRIMARY KEY,
+  status TEXT NOT NULL,
+  created_at TEXT NOT NULL,
+  started_at TEXT,
+  finished_at TEXT,
+  result_json TEXT,
+  error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_status ON ingest_jobs(status);
+
+CREATE TABLE IF NOT EXISTS feed_http_cache (
+  url TEXT PRIMARY KEY,
+  etag TEXT,
+  last_modified TEXT,
+  updated_at TEXT NOT NULL
+);
 """
 
-def db_conn() -> sqlite3.Connection:
+# what /stories reads (matches the Story model)
+STORY_COLUMNS = "id, source, sport, title, link, published, summary, tldr_json, merit_score, badge, created_at"
+
+def _open_conn() -> sqlite3.Connection:
     conn = sqlite3.connect(
         str(DB_PATH),
         timeout=30,
@@ -129,26 +214,92 @@ def db_conn() -> sqlite3.Connection:
     )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA busy_timeout=30000;")   # wait for locks
-    conn.execute("PRAGMA journal_mode=WAL;")     # better concurrency
     conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA cache_size=-64000;")    # ~64mb page cache
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA mmap_size=268435456;")  # 256mb
     return conn
 
+# connections are opened once and reused (one per thread), so the pragmas
+# above only run on first use. callers must NOT close them.
+_DB_LOCAL = threading.local()
+_DB_WRITE_CONN: Optional[sqlite3.Connection] = None
+
+def db_conn() -> sqlite3.Connection:
+    conn = getattr(_DB_LOCAL, "conn", None)
+    if conn is None:
+        conn = _DB_LOCAL.conn = _open_conn()
+    return conn
+
+def db_write_conn() -> sqlite3.Connection:
+    # dedicated connection for /ingest's bulk write, so it never shares
+    # a transaction with the read side
+    global _DB_WRITE_CONN
+    if _DB_WRITE_CONN is None:
+        _DB_WRITE_CONN = _open_conn()
+    return _DB_WRITE_CONN
+
+
+SQLITE_IN_CHUNK = 500  # stays well under SQLITE_MAX_VARIABLE_NUMBER
+
+def existing_story_ids(conn: sqlite3.Connection, ids: List[str]) -> set:
+    found = set()
+    for i in range(0, len(ids), SQLITE_IN_CHUNK):
+        chunk = ids[i:i + SQLITE_IN_CHUNK]
+        marks = ",".join("?" * len(chunk))
+        rows = conn.execute(f"SELECT id FROM stories WHERE id IN ({marks})", chunk)
+        found.update(r["id"] for r in rows)
+    return found
+
+def purge_tldr_cache(conn: sqlite3.Connection):
+    now = datetime.now(timezone.utc).isoformat()
+    conn.execute("DELETE FROM tldr_cache WHERE expires_at <= ?", (now,))
+
+INGEST_JOB_RETENTION = timedelta(days=7)
+
+def purge_ingest_jobs(conn: sqlite3.Connection):
+    # finished jobs are only kept around for GET /ingest/{job_id}
+    cutoff = (datetime.now(timezone.utc) - INGEST_JOB_RETENTION).isoformat()
+    conn.execute(
+        "DELETE FROM ingest_jobs WHERE status IN ('done', 'failed') AND finished_at <= ?",
+        (cutoff,),
+    )
 
 def init_db():
-    conn = db_conn()
+    conn = _open_conn()
     try:
+        conn.execute("PRAGMA journal_mode=WAL;")  # persistent, better concurrency
         conn.executescript(SCHEMA)
+        purge_tldr_cache(conn)
+        purge_ingest_jobs(conn)
         conn.commit()
+        # sqlite_stat1 lets the planner pick the indexes above. full ANALYZE
+        # only when there are no stats yet; otherwise optimize, which
+        # re-analyzes just the tables whose stats went stale (sqlite >= 3.42,
+        # a no-op on older versions)
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone() and conn.execute("SELECT 1 FROM sqlite_stat1 LIMIT 1").fetchone()
+        conn.execute("PRAGMA optimize=0x10002;" if has_stats else "ANALYZE;")
     finally:
         conn.close()
 
+def refresh_latest():
+    # newest created_at; part of the /stories etag + cache key, so bumping it
+    # (end of /ingest) invalidates every cached /stories body at once
+    row = db_conn().execute("SELECT MAX(created_at) AS latest FROM stories").fetchone()
+    app.state.latest = row["latest"]
+
 init_db()
+refresh_latest()
 
 
 # -----------------------------
 # helpers
 # -----------------------------
 def stable_id(link: str) -> str:
+    # ids are stored as the stories primary key and used to dedupe re-ingests,
+    # so the hash must never change: a new one would re-insert every known link
     return hashlib.sha1(link.encode("utf-8")).hexdigest()
 
 def parse_published(entry: Any) -> Optional[str]:
@@ -165,19 +316,42 @@ def parse_published(entry: Any) -> Optional[str]:
             pass
     return None
 
+_SOURCES_CACHE: Optional[Tuple[int, List[Dict[str, str]]]] = None
+_SOURCES_LOCK = threading.Lock()
+
 def load_sources() -> List[Dict[str, str]]:
-    if not SOURCES_PATH.exists():
-        # if missing, create a minimal default
-        SOURCES_PATH.write_text("[]", encoding="utf-8")
-    return json.loads(SOURCES_PATH.read_text(encoding="utf-8"))
+    # re-parse only when sources.json changes on disk (one stat per call)
+    global _SOURCES_CACHE
+    with _SOURCES_LOCK:
+        if not SOURCES_PATH.exists():
+            # if missing, create a minimal default
+            SOURCES_PATH.write_text("[]", encoding="utf-8")
+
+        mtime = SOURCES_PATH.stat().st_mtime_ns
+        if _SOURCES_CACHE is not None and _SOURCES_CACHE[0] == mtime:
+            return _SOURCES_CACHE[1]
+
+        sources = orjson.loads(SOURCES_PATH.read_bytes())
+        _SOURCES_CACHE = (mtime, sources)
+        return sources
 
 _TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_DISAMBIG_RE = re.compile(r"for other uses|this article is about|disambiguation|may refer to", re.IGNORECASE)
 
 def clean_html(s: str) -> str:
     s = s or ""
     s = ihtml.unescape(s)
+    if HTMLParser is not None:
+        try:
+            tree = HTMLParser(s)
+            tree.strip_tags(["script", "style"])  # drop their contents too
+            return _WS_RE.sub(" ", tree.text(separator=" ")).strip()
+        except Exception:
+            pass
     s = _TAG_RE.sub(" ", s)          # remove tags
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
@@ -190,6 +364,19 @@ HEDGE_WORDS = [
 ]
 OFFICIAL_WORDS = ["official", "club statement", "press release", "confirmed", "announced"]
 
+# every signal merit_score needs (numbers, quote marks, hedge/official
+# vocabulary) in one alternation -> a single scan of the body,
+# m.lastgroup tells which bucket a hit came from. matches don't overlap,
+# so an official and a hedge keyword sharing characters (e.g. "set tofficial")
+# only register one of them; separate scans would catch both. harmless on
+# real text, but not exact parity.
+_SIGNAL_RE = re.compile(
+    r"(?P<num>\b\d+(?:[.,]\d+)?\b)"
+    r"|(?P<quote>[\"“”])"
+    "|(?P<official>" + "|".join(map(re.escape, OFFICIAL_WORDS)) + ")"
+    "|(?P<hedge>" + "|".join(map(re.escape, HEDGE_WORDS)) + ")"
+)
+
 def badge(score: int) -> str:
     if score <= 20: return "Speculative"
     if score <= 40: return "Low Evidence"
@@ -197,17 +384,30 @@ def badge(score: int) -> str:
     if score <= 80: return "High Credibility"
     return "Confirmed"
 
-def merit_score(title: str, text: str) -> Dict[str, Any]:
+def merit_core(body: str) -> Tuple[int, int, bool, bool]:
+    """
+    raw signals for an already-lowered body:
+    (numbers, quote marks, has hedging, has official language)
+    """
+    nums = 0
+    quotes = 0
+    hedging = False
+    has_official = False
+    for m in _SIGNAL_RE.finditer(body):
+        kind = m.lastgroup
+        if kind == "num":
+            nums += 1
+        elif kind == "quote":
+            quotes += 1
+        elif kind == "official":
+            has_official = True
+        else:
+            hedging = True
+    return nums, quotes, hedging, has_official
+
+def _merit_score(title: str, text: str) -> Dict[str, Any]:
     body = f"{title}\n{text}".strip().lower()
-
-    nums = len(re.findall(r"\b\d+([.,]\d+)?\b", body))
-    quotes = body.count('"') + body.count("“") + body.count("”")
-
-    hedging_hits = [w for w in HEDGE_WORDS if w in body]
-    official_hits = [w for w in OFFICIAL_WORDS if w in body]
-
-    hedging = len(hedging_hits) > 0
-    has_official = len(official_hits) > 0
+    nums, quotes, hedging, has_official = merit_core(body)
 
     factual_density = min(35, nums * 3 + min(12, quotes))
     evidence_quality = 28 if has_official else (12 - (6 if hedging else 0))
@@ -248,6 +448,29 @@ def merit_score(title: str, text: str) -> Dict[str, Any]:
 
     return {"total": total, "badge": badge(total), "reasons": reasons}
 
+MERIT_CACHE_SIZE = 4096
+_MERIT_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_MERIT_LOCK = threading.Lock()
+
+def merit_score(title: str, text: str) -> Dict[str, Any]:
+    # extension refreshes + ingest reruns score identical text again. keyed on
+    # a 128-bit digest, not the text, so the lru doesn't pin whole pages
+    key = hashlib.blake2b(f"{title}\x00{text}".encode("utf-8"), digest_size=16).digest()
+    with _MERIT_LOCK:
+        hit = _MERIT_CACHE.get(key)
+        if hit is not None:
+            _MERIT_CACHE.move_to_end(key)
+
+    if hit is None:
+        hit = _merit_score(title, text)
+        with _MERIT_LOCK:
+            _MERIT_CACHE[key] = hit
+            if len(_MERIT_CACHE) > MERIT_CACHE_SIZE:
+                _MERIT_CACHE.popitem(last=False)
+
+    # callers get their own reasons list, the cached entry stays untouched
+    return {**hit, "reasons": list(hit["reasons"])}
+
 
 # -----------------------------
 # gemini tldr (rss snippet OR extension text → bullets)
@@ -268,21 +491,22 @@ def gemini_client():
     return _GEMINI_CLIENT
 
 def extractive_fallback(text: str, max_bullets: int = 3) -> List[str]:
-    text = re.sub(r"\s+", " ", (text or "")).strip()
+    text = _WS_RE.sub(" ", (text or "")).strip()
     if not text:
         return []
-    sents = re.split(r"(?<=[.!?])\s+", text)
+    sents = _SENT_RE.split(text)
     out, seen = [], set()
     for s in sents:
         s = s.strip()
         if len(s) < 30:
             continue
-        low = s.lower()
-        if any(x in low for x in ["for other uses", "this article is about", "disambiguation", "may refer to"]):
+        if _DISAMBIG_RE.search(s):
             continue
-        if low in seen:
+        # seen only ever holds the <= max_bullets sentences we keep, so the
+        # sentence itself is a bounded key (no lowered copy per sentence)
+        if s in seen:
             continue
-        seen.add(low)
+        seen.add(s)
         if len(s) > 240:
             s = s[:237].rstrip() + "..."
         out.append(s)
@@ -290,121 +514,328 @@ def extractive_fallback(text: str, max_bullets: int = 3) -> List[str]:
             break
     return out
 
+GEMINI_MODEL = "gemini-2.5-flash"
+TLDR_CACHE_TTL = timedelta(days=7)
+
+# part of the tldr cache key: bump whenever the prompt, system instruction or
+# response schema changes, so bullets from the old prompt stop being served
+TLDR_PROMPT_VERSION = 3
+
+TLDR_MAX_CHARS = 6000
+
+# static part of the prompt, sent as the system instruction so every call
+# shares the same prefix (gemini's implicit prefix caching can reuse it)
+TLDR_INSTRUCTIONS = (
+    "task: write a tldr of the given title + text, with the requested number of bullets.\n"
+    "rules:\n"
+    "- bullets must be short, factual, and not repetitive\n"
+    "- do not invent facts\n"
+)
+
+@lru_cache(maxsize=None)
+def _tldr_config(max_bullets: int) -> types.GenerateContentConfig:
+    # json mode + schema: gemini returns {"bullets": [...]} directly, no
+    # markdown fences or prose to strip
+    return types.GenerateContentConfig(
+        system_instruction=TLDR_INSTRUCTIONS,
+        response_mime_type="application/json",
+        response_schema=types.Schema(
+            type=types.Type.OBJECT,
+            properties={
+                "bullets": types.Schema(
+                    type=types.Type.ARRAY,
+                    items=types.Schema(type=types.Type.STRING),
+                    max_items=max_bullets,
+                ),
+            },
+            required=["bullets"],
+        ),
+    )
+
+def _tldr_clip(text: str) -> str:
+    # cut at the last sentence end before the limit, not mid-sentence
+    text = text or ""
+    if len(text) <= TLDR_MAX_CHARS:
+        return text
+    cut = max(text.rfind(c, 0, TLDR_MAX_CHARS) for c in ".!?")
+    if cut < TLDR_MAX_CHARS // 2:  # no usable boundary, hard cut
+        return text[:TLDR_MAX_CHARS]
+    return text[:cut + 1]
+
+def _tldr_prompt(title: str, text: str, max_bullets: int) -> str:
+    return (
+        f"bullets: {max_bullets}\n"
+        f"title: {title}\n"
+        f"text: {_tldr_clip(text)}\n"
+    )
+
+def _tldr_bullets(raw: str, max_bullets: int) -> List[str]:
+    data = orjson.loads(raw or "{}")
+
+    bullets = data.get("bullets", [])
+    bullets = [b.strip() for b in bullets if isinstance(b, str) and b.strip()]
+    return bullets[:max_bullets]
+
+def tldr_cache_key(title: str, text: str, max_bullets: int) -> str:
+    raw = f"{GEMINI_MODEL}|v{TLDR_PROMPT_VERSION}|{max_bullets}|{title}|{_tldr_clip(text)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def tldr_cache_get(key: str) -> Optional[List[str]]:
+    now = datetime.now(timezone.utc).isoformat()
+    row = db_conn().execute(
+        "SELECT bullets_json FROM tldr_cache WHERE key = ? AND expires_at > ?",
+        (key, now),
+    ).fetchone()
+    return orjson.loads(row["bullets_json"]) if row else None
+
+def tldr_cache_put(key: str, bullets: List[str]):
+    now = datetime.now(timezone.utc)
+    with db_conn() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO tldr_cache (key, bullets_json, created_at, expires_at) VALUES (?, ?, ?, ?)",
+            (
+                key,
+                orjson.dumps(bullets).decode("utf-8"),
+                now.isoformat(),
+                (now + TLDR_CACHE_TTL).isoformat(),
+            ),
+        )
+
+# /analyze summarizes pages the extension user is viewing (possibly private or
+# logged-in), so its bullets only live in this process, never in sqlite
+ANALYZE_TLDR_CACHE_SIZE = 1024
+_ANALYZE_TLDR_CACHE: "OrderedDict[str, List[str]]" = OrderedDict()
+_ANALYZE_TLDR_LOCK = threading.Lock()
+
 def gemini_tldr(title: str, text: str, max_bullets: int = 3) -> List[str]:
     client = gemini_client()
     if client is None:
         return extractive_fallback(text, max_bullets=max_bullets)
 
-    clipped = (text or "")[:6000]
-    prompt = (
-        "return ONLY valid json. no markdown.\n"
-        f"task: write a {max_bullets}-bullet tldr.\n"
-        "rules:\n"
-        "- bullets must be short, factual, and not repetitive\n"
-        "- do not invent facts\n"
-        'output format: {"bullets": ["...","...","..."]}\n\n'
-        f"title: {title}\n"
-        f"text: {clipped}\n"
-    )
+    # only real gemini output is cached, a fallback gets retried next time
+    key = tldr_cache_key(title, text, max_bullets)
+    with _ANALYZE_TLDR_LOCK:
+        cached = _ANALYZE_TLDR_CACHE.get(key)
+        if cached is not None:
+            _ANALYZE_TLDR_CACHE.move_to_end(key)
+            return list(cached)
 
     try:
         resp = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=prompt,
+            model=GEMINI_MODEL,
+            contents=_tldr_prompt(title, text, max_bullets),
+            config=_tldr_config(max_bullets),
         )
-        raw = (resp.text or "").strip()
+        bullets = _tldr_bullets(resp.text, max_bullets)
+    except Exception:
+        bullets = []
 
-        # loose json extraction
-        start = raw.find("{")
-        end = raw.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            raw = raw[start:end+1]
+    if not bullets:
+        return extractive_fallback(text, max_bullets=max_bullets)
+    with _ANALYZE_TLDR_LOCK:
+        _ANALYZE_TLDR_CACHE[key] = list(bullets)
+        if len(_ANALYZE_TLDR_CACHE) > ANALYZE_TLDR_CACHE_SIZE:
+            _ANALYZE_TLDR_CACHE.popitem(last=False)
+    return bullets
 
-        data = json.loads(raw)
+async def gemini_tldr_async(title: str, text: str, max_bullets: int = 3) -> List[str]:
+    client = gemini_client()
+    if client is None:
+        return extractive_fallback(text, max_bullets=max_bullets)
+
+    key = tldr_cache_key(title, text, max_bullets)
+    cached = await asyncio.to_thread(tldr_cache_get, key)
+    if cached:
+        return cached
 
-        bullets = data.get("bullets", [])
-        bullets = [b.strip() for b in bullets if isinstance(b, str) and b.strip()]
-        return bullets[:max_bullets] if bullets else extractive_fallback(text, max_bullets=max_bullets)
+    try:
+        resp = await client.aio.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=_tldr_prompt(title, text, max_bullets),
+            config=_tldr_config(max_bullets),
+        )
+        bullets = _tldr_bullets(resp.text, max_bullets)
     except Exception:
+        bullets = []
+
+    if not bullets:
         return extractive_fallback(text, max_bullets=max_bullets)
+    await asyncio.to_thread(tldr_cache_put, key, bullets)
+    return bullets
+
+GEMINI_CONCURRENCY = 8
+
+async def gemini_tldr_many(items: List[tuple], max_bullets: int = 3) -> List[List[str]]:
+    """
+    items: [(title, text), ...] -> bullets per item, same order.
+    at most GEMINI_CONCURRENCY requests in flight at once.
+    """
+    sem = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+    async def one(title: str, text: str) -> List[str]:
+        async with sem:
+            return await gemini_tldr_async(title, text, max_bullets=max_bullets)
+
+    results = await asyncio.gather(*(one(t, x) for t, x in items), return_exceptions=True)
+    return [
+        extractive_fallback(text, max_bullets=max_bullets) if isinstance(res, BaseException) else res
+        for (_, text), res in zip(items, results)
+    ]
 
 
 # -----------------------------
-# endpoints
+# ingest (rss -> tldr + score -> db)
 # -----------------------------
-@app.post("/ingest", response_model=IngestResponse)
-def ingest():
-    sources = load_sources()
-    fetched_items = 0
-    inserted = 0
-    skipped = 0
+FEED_HEADERS = {
+    "User-Agent": "Sportabase/0.2 (+rss-first)",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+async def fetch_feed(
+    client: httpx.AsyncClient, url: str, cached: Optional[sqlite3.Row]
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """
+    -> (parsed feed or None if unchanged since last run, etag, last-modified)
+    """
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    r = await client.get(url, timeout=12, headers=headers)
+    if r.status_code == 304:
+        return None, None, None
+    r.raise_for_status()
+
+    # hand feedparser the raw bytes (it sniffs the xml encoding itself);
+    # it is sync + cpu-bound, keep it off the event loop
+    feed = await asyncio.to_thread(
+        feedparser.parse,
+        r.content,
+        response_headers={"content-type": r.headers.get("content-type", "")},
+    )
+    return feed, r.headers.get("etag"), r.headers.get("last-modified")
 
-    now = datetime.now(timezone.utc).isoformat()
 
-    conn = db_conn()
-    try:
-        for src in sources:
-            name = src.get("name", "unknown")
-            sport = src.get("sport", "unknown")
-            url = src.get("url", "")
+# run_ingest shares the event loop with every /stories and /analyze request:
+# only the feed fetch and gemini fan-out run on it, the sync parts below
+# (cleaning, scoring, sqlite) go through asyncio.to_thread
+def _feed_validators() -> Dict[str, sqlite3.Row]:
+    conn = db_write_conn()
+    return {
+        r["url"]: r
+        for r in conn.execute("SELECT url, etag, last_modified FROM feed_http_cache")
+    }
 
-            if not url:
-                continue
+def _pending_entries(active: List[Dict[str, str]], results: List[Any], now: str) -> Tuple[List[tuple], List[tuple], int, int]:
+    """
+    fetched feeds -> (new entries to summarize, feed_http_cache rows, fetched, skipped)
+    """
+    candidates = []
+    feed_rows = []
+    for src, res in zip(active, results):
+        if isinstance(res, BaseException):
+            continue
+        feed, etag, last_modified = res
+        if feed is None:  # 304, nothing new
+            continue
+        if etag or last_modified:
+            feed_rows.append((src["url"], etag, last_modified, now))
 
-            try:
-                r = requests.get(
-                    url,
-                    timeout=12,
-                    headers={"User-Agent": "Sportabase/0.2 (+rss-first)"},
-                )
-                r.raise_for_status()
-                feed = feedparser.parse(r.text)
-            except Exception:
+        name = src.get("name", "unknown")
+        sport = src.get("sport", "unknown")
+
+        entries = getattr(feed, "entries", [])[:40]
+        for e in entries:
+            link = getattr(e, "link", None)
+            title = getattr(e, "title", None)
+            if not link or not title:
                 continue
 
-            entries = getattr(feed, "entries", [])[:40]
-            for e in entries:
-                link = getattr(e, "link", None)
-                title = getattr(e, "title", None)
-                if not link or not title:
-                    continue
-
-                fetched_items += 1
-                sid = stable_id(str(link))
-
-                exists = conn.execute("SELECT 1 FROM stories WHERE id = ?", (sid,)).fetchone()
-                if exists:
-                    skipped += 1
-                    continue
-
-                summary_html = getattr(e, "summary", "") or ""
-                summary = clean_html(summary_html)
-
-                published = parse_published(e)
-
-                # rss-first: summarize snippet, not full article
-                tldr = gemini_tldr(str(title), str(summary), max_bullets=3)
-
-                score = merit_score(str(title), str(summary))
-                conn.execute(
-                    """
-                    INSERT INTO stories (id, source, sport, title, link, published, summary, tldr_json, merit_score, badge, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        sid, name, sport, str(title).strip(), str(link).strip(),
-                        published, str(summary).strip(),
-                        json.dumps(tldr, ensure_ascii=False),
-                        int(score["total"]),
-                        str(score["badge"]),
-                        now,
-                    ),
-                )
-                inserted += 1
+            candidates.append((stable_id(str(link)), name, sport, e))
+
+    # one IN (...) lookup per chunk instead of a SELECT per entry
+    seen = existing_story_ids(db_write_conn(), [c[0] for c in candidates])
 
+    skipped = 0
+    pending = []
+    for sid, name, sport, e in candidates:
+        if sid in seen:
+            skipped += 1
+            continue
+        seen.add(sid)
+
+        summary_html = getattr(e, "summary", "") or ""
+        summary = clean_html(summary_html)
+
+        published = parse_published(e)
+        pending.append((sid, name, sport, str(e.title), str(e.link), published, summary))
+
+    return pending, feed_rows, len(candidates), skipped
+
+def _store_ingest(pending: List[tuple], tldrs: List[List[str]], feed_rows: List[tuple], now: str) -> int:
+    rows = []
+    for (sid, name, sport, title, link, published, summary), tldr in zip(pending, tldrs):
+        score = merit_score(title, summary)
+        rows.append(
+            (
+                sid, name, sport, title.strip(), link.strip(),
+                published, summary.strip(),
+                orjson.dumps(tldr).decode("utf-8"),
+                int(score["total"]),
+                str(score["badge"]),
+                now,
+            )
+        )
+
+    conn = db_write_conn()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            """
+            INSERT INTO stories (id, source, sport, title, link, published, summary, tldr_json, merit_score, badge, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        # saved with the stories so a failed run refetches in full next time
+        conn.executemany(
+            "INSERT OR REPLACE INTO feed_http_cache (url, etag, last_modified, updated_at) VALUES (?, ?, ?, ?)",
+            feed_rows,
+        )
+        purge_tldr_cache(conn)
+        purge_ingest_jobs(conn)
         conn.commit()
-    finally:
-        conn.close()
+    except Exception:
+        conn.rollback()
+        raise
+    refresh_latest()
+    return len(rows)
+
+async def run_ingest() -> IngestResponse:
+    sources = await asyncio.to_thread(load_sources)
+    now = datetime.now(timezone.utc).isoformat()
+
+    validators = await asyncio.to_thread(_feed_validators)
+
+    # fetch every feed concurrently; a failed source just drops out
+    active = [src for src in sources if src.get("url")]
+    async with httpx.AsyncClient(headers=FEED_HEADERS, follow_redirects=True) as client:
+        results = await asyncio.gather(
+            *(fetch_feed(client, src["url"], validators.get(src["url"])) for src in active),
+            return_exceptions=True,
+        )
+
+    pending, feed_rows, fetched_items, skipped = await asyncio.to_thread(
+        _pending_entries, active, results, now
+    )
+
+    # rss-first: summarize snippet, not full article
+    tldrs = await gemini_tldr_many([(p[3], p[6]) for p in pending], max_bullets=3)
+
+    inserted = await asyncio.to_thread(_store_ingest, pending, tldrs, feed_rows, now)
 
     return IngestResponse(
         sources=len(sources),
@@ -414,52 +845,206 @@ def ingest():
     )
 
 
+# ingest runs as a queued job, drained by one background worker
+def _job_from_row(r: sqlite3.Row) -> IngestJob:
+    return IngestJob(
+        job_id=r["id"],
+        status=r["status"],
+        created_at=r["created_at"],
+        started_at=r["started_at"],
+        finished_at=r["finished_at"],
+        result=orjson.loads(r["result_json"]) if r["result_json"] else None,
+        error=r["error"],
+    )
+
+def get_ingest_job(job_id: str) -> Optional[IngestJob]:
+    row = db_conn().execute("SELECT * FROM ingest_jobs WHERE id = ?", (job_id,)).fetchone()
+    return _job_from_row(row) if row else None
+
+def _queue_job(job_id: str):
+    app.state.ingest_pending.add(job_id)
+    app.state.ingest_queue.put_nowait(job_id)
+
+def _find_or_create_job(pending: frozenset) -> Tuple[IngestJob, bool]:
+    """
+    -> (job, True if it was just created and still needs queueing)
+    """
+    # a job that hasn't started yet will pick up everything new anyway,
+    # so repeat requests share it instead of queueing another run.
+    # only rows actually waiting in the queue count: one the worker dequeued
+    # but couldn't update (db error) must not swallow every later request
+    conn = db_conn()
+    rows = conn.execute(
+        "SELECT * FROM ingest_jobs WHERE status = 'queued' ORDER BY created_at"
+    ).fetchall()
+    for row in rows:
+        if row["id"] in pending:
+            return _job_from_row(row), False
+
+    job_id = uuid.uuid4().hex
+    now = datetime.now(timezone.utc).isoformat()
+    with conn:
+        conn.execute(
+            "INSERT INTO ingest_jobs (id, status, created_at) VALUES (?, 'queued', ?)",
+            (job_id, now),
+        )
+    return IngestJob(job_id=job_id, status="queued", created_at=now), True
+
+async def enqueue_ingest() -> IngestJob:
+    # the sqlite part can wait out busy_timeout behind another writer, so it
+    # runs in a thread; only the asyncio.Queue handoff stays on the loop.
+    # the lock keeps two concurrent calls from both creating a job
+    async with app.state.ingest_enqueue_lock:
+        job, created = await asyncio.to_thread(
+            _find_or_create_job, frozenset(app.state.ingest_pending)
+        )
+        if created:
+            _queue_job(job.job_id)
+    return job
+
+def recover_ingest_jobs() -> List[str]:
+    # jobs from a previous process: queued ones are picked up again,
+    # one that was mid-run has lost its state and is marked failed
+    now = datetime.now(timezone.utc).isoformat()
+    conn = db_conn()
+    with conn:
+        conn.execute(
+            "UPDATE ingest_jobs SET status = 'failed', finished_at = ?, error = 'interrupted' WHERE status = 'running'",
+            (now,),
+        )
+    rows = conn.execute(
+        "SELECT id FROM ingest_jobs WHERE status = 'queued' ORDER BY created_at"
+    ).fetchall()
+    return [r["id"] for r in rows]
+
+def _start_job(job_id: str):
+    now = datetime.now(timezone.utc).isoformat()
+    with db_conn() as conn:
+        conn.execute(
+            "UPDATE ingest_jobs SET status = 'running', started_at = ? WHERE id = ?",
+            (now, job_id),
+        )
+
+def _finish_job(job_id: str, status: str, result_json: Optional[str] = None, error: Optional[str] = None):
+    now = datetime.now(timezone.utc).isoformat()
+    with db_conn() as conn:
+        conn.execute(
+            "UPDATE ingest_jobs SET status = ?, finished_at = ?, result_json = ?, error = ? WHERE id = ?",
+            (status, now, result_json, error, job_id),
+        )
+
+async def ingest_worker():
+    # one worker -> ingests never overlap
+    queue: asyncio.Queue = app.state.ingest_queue
+    while True:
+        job_id = await queue.get()
+        app.state.ingest_pending.discard(job_id)
+        # any error (including the job-status writes themselves) fails this
+        # job only; the worker must survive to drain the rest of the queue
+        try:
+            await asyncio.to_thread(_start_job, job_id)
+            result = await run_ingest()
+            await asyncio.to_thread(_finish_job, job_id, "done", result_json=result.model_dump_json())
+        except Exception as e:
+            log.exception("ingest job %s failed", job_id)
+            try:
+                await asyncio.to_thread(_finish_job, job_id, "failed", error=f"{type(e).__name__}: {e}")
+            except Exception:
+                log.exception("could not mark ingest job %s failed", job_id)
+        finally:
+            queue.task_done()
+
+async def ingest_scheduler(interval_minutes: float):
+    while True:
+        await asyncio.sleep(interval_minutes * 60)
+        try:
+            await enqueue_ingest()
+        except Exception:
+            # skip this tick, try again on the next one
+            log.exception("scheduled ingest could not be queued")
+
+
+# -----------------------------
+# endpoints
+# -----------------------------
+@app.post("/ingest", response_model=IngestJob, status_code=202)
+async def ingest():
+    # async on purpose: asyncio.Queue must be touched from the event loop
+    return await enqueue_ingest()
+
+
+@app.get("/ingest/{job_id}", response_model=IngestJob)
+def ingest_status(job_id: str):
+    job = get_ingest_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="unknown job")
+    return job
+
+
+@lru_cache(maxsize=256)
+def _stories_body(sport: Optional[str], source: Optional[str], limit: int, latest: Optional[str]) -> bytes:
+    # latest is only part of the cache key
+    conn = db_conn()
+    where = []
+    params: List[Any] = []
+
+    if sport:
+        where.append("sport = ?")
+        params.append(sport)
+
+    if source:
+        where.append("source = ?")
+        params.append(source)
+
+    sql = f"SELECT {STORY_COLUMNS} FROM stories"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY created_at DESC LIMIT ?"
+    params.append(limit)
+
+    rows = conn.execute(sql, tuple(params)).fetchall()
+    out: List[Dict[str, Any]] = []
+    for r in rows:
+        out.append(
+            {
+                "id": r["id"],
+                "source": r["source"],
+                "sport": r["sport"],
+                "title": r["title"],
+                "link": r["link"],
+                "published": r["published"],
+                "summary": r["summary"] or "",
+                # stored column is already a json array (written by orjson in
+                # /ingest) -> splice it into the body as-is, no decode/re-encode
+                "tldr": orjson.Fragment(r["tldr_json"] or "[]"),
+                "merit_score": int(r["merit_score"] or 0),
+                "badge": r["badge"] or badge(int(r["merit_score"] or 0)),
+                "created_at": r["created_at"],
+            }
+        )
+    return orjson.dumps(out)
+
+
 @app.get("/stories", response_model=List[Story])
 def stories(
+    request: Request,
     sport: Optional[str] = Query(default=None),
     source: Optional[str] = Query(default=None),
     limit: int = Query(default=30, ge=1, le=200),
 ):
-    conn = db_conn()
-    try:
-        where = []
-        params: List[Any] = []
-
-        if sport:
-            where.append("sport = ?")
-            params.append(sport)
-
-        if source:
-            where.append("source = ?")
-            params.append(source)
-
-        sql = "SELECT * FROM stories"
-        if where:
-            sql += " WHERE " + " AND ".join(where)
-        sql += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
-
-        rows = conn.execute(sql, tuple(params)).fetchall()
-        out: List[Story] = []
-        for r in rows:
-            out.append(
-                Story(
-                    id=r["id"],
-                    source=r["source"],
-                    sport=r["sport"],
-                    title=r["title"],
-                    link=r["link"],
-                    published=r["published"],
-                    summary=r["summary"] or "",
-                    tldr=json.loads(r["tldr_json"] or "[]"),
-                    merit_score=int(r["merit_score"] or 0),
-                    badge=r["badge"] or badge(int(r["merit_score"] or 0)),
-                    created_at=r["created_at"],
-                )
-            )
-        return out
-    finally:
-        conn.close()
+    latest = app.state.latest
+    etag = '"' + hashlib.sha1(f"{sport}|{source}|{limit}|{latest}".encode("utf-8")).hexdigest() + '"'
+    headers = {"ETag": etag}
+
+    # nothing ingested since the client's copy -> no db work, no encoding
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=_stories_body(sport, source, limit, latest),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @app.post("/analyze", response_model=AnalyzeResponse)
@@ -469,7 +1054,8 @@ def analyze(req: AnalyzeRequest):
     - user is already viewing the page (logged in if needed)
     - extension extracts readable text and sends it here
     - we return tldr + merit score
-    - we DO NOT store req.text anywhere
+    - we DO NOT store req.text anywhere; the tldr is only kept in an
+      in-process cache (lost on restart), never written to the db
     """
     tldr = gemini_tldr(req.title, req.text, max_bullets=req.max_bullets)
     score = merit_score(req.title, req.text)